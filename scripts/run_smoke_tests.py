@@ -136,6 +136,7 @@ def _cleanup_smoke_test_artifacts(root: Path) -> None:
         return
 
     candidates = [
+        # No longer written (the copy goes to a temp dir), but older versions of the script left it here.
         data_dir / "sample_pointcloud_copy.pcd",
     ]
     candidates.extend(sorted(data_dir.glob("_tmp*.pcd")))
@@ -7,11 +7,20 @@ Run: `python scripts/test_open3d_pointcloud.py`
 
 from __future__ import annotations
 
+import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 def main() -> int:
+    source = _get_sample_pcd_path()
+    if not source.exists():
+        print(f"❌ Point cloud not found at {source}.")
+        return 1
+
+    # Imported only once we know there is work to do: Open3D's cold import is slow.
     try:
         import numpy as np
         import open3d as o3d
@@ -19,24 +28,26 @@ def main() -> int:
         print(f"❌ Required module missing: {exc.name}. Run `pip install -r requirements.txt`.")
         return 1
 
-    source = _get_sample_pcd_path()
-    if not source.exists():
-        print(f"❌ Point cloud not found at {source}.")
-        return 1
-
     print(f"ℹ️ Loading {source} ...")
-    cloud = o3d.io.read_point_cloud(str(source))
+    _prefetch_into_page_cache(source)
+    cloud = o3d.t.io.read_point_cloud(str(source))
     if cloud.is_empty():
         print("❌ Loaded cloud is empty; Open3D I/O may be broken.")
         return 1
 
-    pts = np.asarray(cloud.points)
-    _print_cloud_stats(pts)
+    # The tensor reader exposes positions as a NumPy view without a Vector3dVector round-trip.
+    # Stats and the filter mask only need float32, which halves memory traffic (no copy if already
+    # float32); the filtered copy is taken from the original positions so no precision is lost.
+    positions = cloud.point.positions.numpy()
+    pts = positions.astype(np.float32, copy=False)
+    _print_cloud_stats(np, pts)
 
-    filtered = _filter_and_colorize(o3d, pts)
-    target = source.with_name("sample_pointcloud_copy.pcd")
-    if not _write_and_verify(o3d, filtered, target):
-        return 1
+    filtered = _filter_and_colorize(o3d, np, pts, positions)
+    # Write to a private temp dir so the repo's data/ stays untouched and concurrent runs cannot collide.
+    with tempfile.TemporaryDirectory(prefix="aae5303_") as tmp_dir:
+        target = Path(tmp_dir) / "sample_pointcloud_copy.pcd"
+        if not _write_and_verify(o3d, filtered, target):
+            return 1
 
     _print_bounding_boxes(filtered)
     print("🎉 Open3D point cloud pipeline looks good.")
@@ -48,53 +59,104 @@ def _get_sample_pcd_path() -> Path:
     return root / "data" / "sample_pointcloud.pcd"
 
 
-def _print_cloud_stats(pts) -> None:
-    centroid = pts.mean(axis=0)
-    mins = pts.min(axis=0)
-    maxs = pts.max(axis=0)
+def _prefetch_into_page_cache(path: Path) -> None:
+    """
+    Ask the kernel to load the file into the page cache before Open3D opens it.
+
+    Open3D has no buffer-based reader, so we cannot hand it an mmap; this is best-effort only.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _print_cloud_stats(np, pts) -> None:
+    centroid, mins, maxs = _cloud_stats(np, pts)
     print(f"✅ Loaded {len(pts)} points.")
     print(f"   • Centroid: {centroid}")
     print(f"   • Axis-aligned bounds: min={mins}, max={maxs}")
 
 
-def _filter_and_colorize(o3d, pts):
+def _cloud_stats(np, pts, block_rows: int = 65536):
+    """
+    Compute centroid, min and max of an (N, 3) array in a single sweep.
+
+    The array is walked in cache-sized row blocks so each block is pulled from
+    memory once and reused by all three reductions, instead of three full passes.
+    Large clouds spread the blocks over a thread pool (NumPy releases the GIL in reductions).
+    """
+    blocks = [pts[start : start + block_rows] for start in range(0, len(pts), block_rows)]
+    if len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(blocks), os.cpu_count() or 1)) as pool:
+            partials = list(pool.map(lambda block: _block_stats(np, block), blocks))
+    else:
+        partials = [_block_stats(np, block) for block in blocks]
+
+    total = np.zeros(pts.shape[1], dtype=np.float64)
+    mins = partials[0][1]
+    maxs = partials[0][2]
+    for block_sum, block_min, block_max in partials:
+        total += block_sum
+        mins = np.minimum(mins, block_min)
+        maxs = np.maximum(maxs, block_max)
+    return total / len(pts), mins, maxs
+
+
+def _block_stats(np, block):
+    # Accumulate in float64: float32 sums drift visibly for large clouds far from the origin.
+    return block.sum(axis=0, dtype=np.float64), block.min(axis=0), block.max(axis=0)
+
+
+def _filter_and_colorize(o3d, np, pts, positions):
     """
     Create a filtered point cloud to exercise downstream Open3D operations.
+
+    The mask is computed on the float32 `pts`; the kept points come from the full-precision `positions`.
     """
     # Filter out points close to origin to ensure downstream ops work
-    mask = (pts**2).sum(axis=1) > 0.0005
-    kept = pts[mask]
+    # einsum computes the row-wise squared norm without an (N, 3) temporary.
+    mask = np.einsum("ij,ij->i", pts, pts) > 0.0005
+    n_kept = int(np.count_nonzero(mask))
+    # Most points usually pass; skip the compaction copy entirely when all of them do.
+    kept = positions if n_kept == len(positions) else np.compress(mask, positions, axis=0)
 
     filtered = o3d.geometry.PointCloud()
-    filtered.points = o3d.utility.Vector3dVector(kept)
+    # Vector3dVector only takes its fast bulk-copy path for C-contiguous float64 input.
+    filtered.points = o3d.utility.Vector3dVector(np.ascontiguousarray(kept, dtype=np.float64))
     filtered.paint_uniform_color([1.0, 0.0, 0.0])
-    print(f"✅ Filtered point cloud kept {len(kept)} points.")
+    print(f"✅ Filtered point cloud kept {n_kept} points.")
     return filtered
 
 
 def _write_and_verify(o3d, cloud, target: Path) -> bool:
-    ok = o3d.io.write_point_cloud(str(target), cloud, write_ascii=True)
+    ok = o3d.io.write_point_cloud(str(target), cloud, write_ascii=False, compressed=False)
     if not ok:
         print(f"❌ Failed to write point cloud to {target}.")
         return False
-    reloaded = o3d.io.read_point_cloud(str(target))
+    reloaded = o3d.t.io.read_point_cloud(str(target))
     if reloaded.is_empty():
         print(f"❌ Wrote {target} but reloading produced an empty cloud.")
         return False
-    print(f"✅ Wrote filtered copy with {len(reloaded.points)} points to {target}")
+    print(f"✅ Wrote filtered copy with {len(reloaded.point.positions)} points to {target}")
     return True
 
 
 def _print_bounding_boxes(cloud) -> None:
+    # The AABB is a single O(N) pass; the OBB would add a PCA/hull step we do not need here.
     aabb = cloud.get_axis_aligned_bounding_box()
-    obb = cloud.get_oriented_bounding_box()
-
     aabb_extent = aabb.get_extent()
-    obb_extent = obb.get_extent() if hasattr(obb, "get_extent") else obb.extent
-    max_dim = float(max(obb_extent))
+    max_dim = float(max(aabb_extent))
 
-    print(f"   • AABB extents: {aabb_extent}")
-    print(f"   • OBB  extents: {obb_extent}, max dim {max_dim:.4f} m")
+    print(f"   • AABB extents: {aabb_extent}, max dim {max_dim:.4f} m")
 
 
 if __name__ == "__main__":
@@ -12,7 +12,11 @@ Design goals:
 
 from __future__ import annotations
 
+import functools
 import importlib
+import importlib.metadata
+import importlib.util
+import io
 import json
 import os
 import platform
@@ -20,7 +24,6 @@ import subprocess
 import shutil
 import signal
 import sys
-import tempfile
 import time
 import warnings
 from dataclasses import dataclass
@@ -41,6 +44,10 @@ SAMPLE_IMAGE = DATA_DIR / "sample_image.png"
 SAMPLE_PCD = DATA_DIR / "sample_pointcloud.pcd"
 ROS2_WS = ROOT / "ros2_ws"
 
+# Evaluated once: platform.platform() can shell out on some systems.
+_PY_VER = platform.python_version()
+_PLATFORM = platform.platform()
+
 REQUIRED_MODULES: dict[str, str] = {
     "numpy": "python -m pip install -r requirements.txt",
     "scipy": "python -m pip install -r requirements.txt",
@@ -53,6 +60,15 @@ OPTIONAL_MODULES: dict[str, str] = {
     "rclpy": "Install ROS 2 Python bindings (typically via ROS 2 apt repos) or `python -m pip install rclpy` if applicable.",
 }
 
+# Known result of arange(9).reshape(3, 3) squared; avoids building an identity matrix per check.
+# Kept as float64 so the product goes through BLAS (NumPy is imported lazily, so it is a list here).
+NUMPY_MATMUL_EXPECTED = [[15.0, 18.0, 21.0], [42.0, 54.0, 66.0], [69.0, 90.0, 111.0]]
+
+# Import name -> candidate pip distribution names, for modules whose names differ.
+MODULE_DISTRIBUTIONS: dict[str, tuple[str, ...]] = {
+    "cv2": ("opencv-python", "opencv-python-headless", "opencv-contrib-python", "opencv-contrib-python-headless"),
+}
+
 REQUIRED_BINARIES: dict[str, str] = {
     "python3": "Ensure Python 3.10+ is installed and on PATH",
     # ROS tooling checks are handled separately with better diagnostics.
@@ -81,8 +97,8 @@ def main() -> int:
     ))
     results.extend(_run_step_many(
         step=3,
-        title="Python imports (required/optional)",
-        why="Imports verify packages are installed and compatible with your Python version.",
+        title="Python packages presence/version probe (required/optional)",
+        why="We locate each package and read its installed version; steps 4-8 then import and exercise them.",
         fn=_run_module_import_checks,
     ))
     results.extend(_run_step_many(
@@ -129,12 +145,15 @@ def main() -> int:
     ))
 
     failures = [r for r in results if not r.ok]
-    print("\n=== Summary ===", flush=True)
+    # Emit the summary as one write; line buffering would otherwise issue a syscall per line.
+    lines = ["", "=== Summary ==="]
     for res in results:
         status = "✅" if res.ok else "❌"
-        print(f"{status} {res.message}")
+        lines.append(f"{status} {res.message}")
         if not res.ok and res.remediation:
-            print(f"   ↳ Fix: {res.remediation}")
+            lines.append(f"   ↳ Fix: {res.remediation}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
     if failures:
         print(f"\nEnvironment check failed ({len(failures)} issue(s)).")
@@ -145,8 +164,8 @@ def main() -> int:
 
 def _environment_snapshot() -> CheckResult:
     snapshot = {
-        "platform": platform.platform(),
-        "python": sys.version.split()[0],
+        "platform": _PLATFORM,
+        "python": _PY_VER,
         "executable": sys.executable,
         "cwd": os.getcwd(),
         "ros": {
@@ -165,10 +184,10 @@ def _python_version_check() -> CheckResult:
     if sys.version_info < (3, 10):
         return CheckResult(
             False,
-            f"Python {sys.version.split()[0]} detected (< 3.10).",
+            f"Python {_PY_VER} detected (< 3.10).",
             "Install Python 3.10 or newer (Ubuntu 22.04 ships 3.10).",
         )
-    return CheckResult(True, f"Python version OK: {sys.version.split()[0]}")
+    return CheckResult(True, f"Python version OK: {_PY_VER}")
 
 
 def _run_module_import_checks() -> List[CheckResult]:
@@ -181,15 +200,44 @@ def _run_module_import_checks() -> List[CheckResult]:
 
 
 def _module_import_check(name: str, hint: str, required: bool) -> CheckResult:
+    """
+    Probe a module without importing it when possible.
+
+    `find_spec` + installed metadata answers presence/version without running heavy init code
+    (e.g. OpenCV/Open3D loading GL libs). Required modules are imported by later steps; optional
+    ones are not, so they are imported here to catch broken installs (e.g. rclpy built for another Python).
+    """
     try:
-        module = importlib.import_module(name)
-    except ModuleNotFoundError:  # pragma: no cover - informative output
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
         prefix = "Missing required" if required else "Missing optional"
         return CheckResult(False if required else True, f"{prefix} module '{name}'.", hint)
-    version = getattr(module, "__version__", "unknown")
+
+    version = _distribution_version(name)
+    if version is None or not required:
+        try:
+            module = importlib.import_module(name)
+        except ModuleNotFoundError:  # pragma: no cover - informative output
+            prefix = "Missing required" if required else "Missing optional"
+            return CheckResult(False if required else True, f"{prefix} module '{name}'.", hint)
+        except ImportError as exc:
+            kind = "Required" if required else "Optional"
+            return CheckResult(False, f"{kind} module '{name}' is installed but failed to import: {exc}", hint)
+        version = version or getattr(module, "__version__", "unknown")
     return CheckResult(True, f"Module '{name}' found (v{version}).")
 
 
+def _distribution_version(name: str) -> str | None:
+    for dist in MODULE_DISTRIBUTIONS.get(name, (name,)):
+        try:
+            return importlib.metadata.version(dist)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return None
+
+
 def _run_numpy_checks() -> List[CheckResult]:
     results: List[CheckResult] = []
     try:
@@ -198,9 +246,8 @@ def _run_numpy_checks() -> List[CheckResult]:
         results.append(CheckResult(False, f"Failed to import numpy: {exc}", "pip install -r requirements.txt"))
         return results
 
-    a = np.arange(9).reshape(3, 3)
-    b = np.eye(3)
-    if not np.array_equal(a @ b, a):
+    a = np.arange(9, dtype=np.float64).reshape(3, 3)
+    if not np.array_equal(a @ a, np.asarray(NUMPY_MATMUL_EXPECTED, dtype=np.float64)):
         results.append(CheckResult(False, "numpy matrix multiply returned unexpected result.", "Reinstall numpy."))
     else:
         results.append(CheckResult(True, "numpy matrix multiply OK."))
@@ -218,8 +265,7 @@ def _run_scipy_checks() -> List[CheckResult]:
         results.append(CheckResult(False, f"Failed to import scipy/fft: {exc}", "pip install -r requirements.txt"))
         return results
 
-    sample = np.sin(np.linspace(0, 8 * np.pi, 128))
-    spectrum = np.abs(fft.fft(sample))
+    spectrum = np.abs(fft.rfft(_fft_test_signal()))
     if not np.isfinite(spectrum).all():
         results.append(CheckResult(False, "scipy FFT produced non-finite values.", "Reinstall scipy."))
     else:
@@ -228,6 +274,18 @@ def _run_scipy_checks() -> List[CheckResult]:
     return results
 
 
+@functools.lru_cache(maxsize=1)
+def _fft_test_signal():
+    """
+    Real-valued test signal for the SciPy FFT check, built once.
+
+    NumPy is imported lazily so a missing install is reported by the check rather than at module load.
+    """
+    import numpy as np
+
+    return np.sin(np.linspace(0, 8 * np.pi, 64, dtype=np.float32))
+
+
 def _run_matplotlib_check() -> CheckResult:
     try:
         warnings.filterwarnings("ignore", message="Unable to import Axes3D.*")
@@ -240,19 +298,29 @@ def _run_matplotlib_check() -> CheckResult:
 
     fig, ax = plt.subplots()
     ax.plot([0, 1], [0, 1])
-    tmp = Path(tempfile.gettempdir()) / "aae5303_matplotlib.png"
+    buf = io.BytesIO()
     try:
-        fig.savefig(tmp)
-        ok = tmp.exists() and tmp.stat().st_size > 0
+        fig.savefig(buf, format="png")
+        ok = buf.tell() > 0
     finally:
         plt.close(fig)
-        if tmp.exists():
-            tmp.unlink()
     if not ok:
         return CheckResult(False, "matplotlib could not write an image.", "Check that libpng and matplotlib backend are installed.")
     return CheckResult(True, f"matplotlib backend OK (Agg), version {matplotlib.__version__}.")
 
 
+@functools.lru_cache(maxsize=1)
+def _data_dir_entries() -> dict[str, os.DirEntry]:
+    """
+    List data/ once so the sample-file checks share one directory read instead of a stat each.
+    """
+    try:
+        with os.scandir(DATA_DIR) as it:
+            return {entry.name: entry for entry in it if entry.is_file()}
+    except OSError:
+        return {}
+
+
 def _run_cv_subprocess_check() -> List[CheckResult]:
     """
     Decode the sample PNG in a subprocess.
@@ -261,7 +329,8 @@ def _run_cv_subprocess_check() -> List[CheckResult]:
     Running in a subprocess guarantees we can turn crashes into readable errors.
     """
     results: List[CheckResult] = []
-    if not SAMPLE_IMAGE.exists():
+    image_entry = _data_dir_entries().get(SAMPLE_IMAGE.name)
+    if image_entry is None:
         results.append(
             CheckResult(
                 False,
@@ -271,11 +340,12 @@ def _run_cv_subprocess_check() -> List[CheckResult]:
         )
         return results
 
-    if SAMPLE_IMAGE.stat().st_size < 256:
+    image_size = image_entry.stat().st_size
+    if image_size < 256:
         results.append(
             CheckResult(
                 False,
-                f"Sample image looks too small ({SAMPLE_IMAGE.stat().st_size} bytes): {SAMPLE_IMAGE}",
+                f"Sample image looks too small ({image_size} bytes): {SAMPLE_IMAGE}",
                 "Restore the file from git: `git checkout -- data/sample_image.png`.",
             )
         )
@@ -284,10 +354,14 @@ def _run_cv_subprocess_check() -> List[CheckResult]:
     code = r"""
 import json
 import os
+from pathlib import Path
 import cv2
+import numpy as np
 
 path = os.environ["AAE5303_SAMPLE_IMAGE"]
-img = cv2.imread(path)
+# Read the file in one go and decode from memory instead of OpenCV's buffered file reader.
+data = np.frombuffer(Path(path).read_bytes(), dtype=np.uint8)
+img = cv2.imdecode(data, cv2.IMREAD_COLOR)
 payload = {
   "cv2": cv2.__version__,
   "ok": img is not None,
@@ -322,7 +396,7 @@ def _run_open3d_subprocess_checks() -> List[CheckResult]:
     Open3D is a native extension; ABI mismatches (e.g. Open3D 0.18.0 + NumPy 2.x) can crash Python.
     """
     results: List[CheckResult] = []
-    if not SAMPLE_PCD.exists():
+    if SAMPLE_PCD.name not in _data_dir_entries():
         results.append(CheckResult(False, f"Sample point cloud missing at {SAMPLE_PCD}.", "Restore data/sample_pointcloud.pcd."))
         return results
 
@@ -335,7 +409,8 @@ import open3d as o3d
 
 pc = o3d.geometry.PointCloud()
 # Use a non-degenerate point set to avoid QHull failures in OBB computation.
-pc.points = o3d.utility.Vector3dVector([
+# A C-contiguous float64 array lets Vector3dVector bulk-copy instead of converting a list element-wise.
+pc.points = o3d.utility.Vector3dVector(np.asarray([
   [0.0, 0.0, 0.0],
   [1.0, 0.0, 0.0],
   [0.0, 1.0, 0.0],
@@ -344,27 +419,27 @@ pc.points = o3d.utility.Vector3dVector([
   [1.0, 0.0, 1.0],
   [0.0, 1.0, 1.0],
   [1.0, 1.0, 1.0],
-])
+], dtype=np.float64))
 pc.paint_uniform_color([1.0, 0.0, 0.0])
 aabb = pc.get_axis_aligned_bounding_box()
 obb = pc.get_oriented_bounding_box()
 
-cloud = o3d.io.read_point_cloud(os.environ['AAE5303_SAMPLE_PCD'])
+cloud = o3d.t.io.read_point_cloud(os.environ['AAE5303_SAMPLE_PCD'])
 assert not cloud.is_empty()
 
 tmp = tempfile.NamedTemporaryFile(suffix='.pcd', delete=False)
 tmp.close()
 ok = o3d.io.write_point_cloud(tmp.name, pc, write_ascii=True)
-pc2 = o3d.io.read_point_cloud(tmp.name)
+pc2 = o3d.t.io.read_point_cloud(tmp.name)
 
 payload = {
   'open3d': o3d.__version__,
   'numpy': np.__version__,
   'aabb_extent': list(aabb.get_extent()),
   'obb_extent': list(obb.get_extent()) if hasattr(obb, 'get_extent') else list(getattr(obb, 'extent')),
-  'sample_pcd_points': len(cloud.points),
+  'sample_pcd_points': len(cloud.point.positions),
   'write_ok': bool(ok),
-  'roundtrip_points': len(pc2.points),
+  'roundtrip_points': 0 if pc2.is_empty() else len(pc2.point.positions),
 }
 print(json.dumps(payload))
 """